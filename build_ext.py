@@ -15,8 +15,10 @@ except ImportError:
 _LOGGER = logging.getLogger(__name__)
 
 TO_CYTHONIZE = [
+    "src/annotatedyaml/clone.py",
     "src/annotatedyaml/constructors.py",
     "src/annotatedyaml/reference.py",
+    "src/annotatedyaml/reference_object.py",
 ]
 
 EXTENSIONS = [
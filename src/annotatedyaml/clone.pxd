@@ -0,0 +1,14 @@
+import cython
+
+cdef object copy
+cdef object NodeDictClass
+cdef object NodeListClass
+cdef object NodeStrClass
+
+
+cpdef object _fast_clone(object obj)
+
+@cython.locals(obj_id=object)
+cdef object _clone(object obj, dict memo)
+
+cdef void _copy_reference(object obj, object new_obj)
@@ -0,0 +1,58 @@
+"""Copy loaded YAML."""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from .objects import NodeDictClass, NodeListClass, NodeStrClass
+
+
+def _fast_clone(obj: Any) -> Any:
+    """Return a deep copy of loaded YAML, keeping file references."""
+    return _clone(obj, {})
+
+
+def _clone(obj: Any, memo: dict[int, Any]) -> Any:
+    """Copy an object, memo maps containers to their copy for anchors."""
+    obj_type = type(obj)
+    if obj_type is str or obj_type is int or obj_type is float or obj_type is bool:
+        return obj
+    if obj is None:
+        return None
+    if obj_type is NodeStrClass:
+        new_str = NodeStrClass(obj)
+        _copy_reference(obj, new_str)
+        return new_str
+
+    obj_id = id(obj)
+    if obj_id in memo:
+        return memo[obj_id]
+
+    if obj_type is NodeDictClass or obj_type is dict:
+        new_dict = memo[obj_id] = obj_type()
+        for key, value in obj.items():
+            new_dict[key] = _clone(value, memo)
+        if obj_type is NodeDictClass:
+            _copy_reference(obj, new_dict)
+        return new_dict
+    if obj_type is NodeListClass or obj_type is list:
+        new_list = memo[obj_id] = obj_type()
+        for value in obj:
+            new_list.append(_clone(value, memo))
+        if obj_type is NodeListClass:
+            _copy_reference(obj, new_list)
+        return new_list
+
+    # Anything else the safe loader can produce (dates, sets, Input, ...)
+    return copy.deepcopy(obj)
+
+
+def _copy_reference(obj: Any, new_obj: Any) -> None:
+    """Copy the file reference from one node class object to another."""
+    try:
+        new_obj.__config_file__ = obj.__config_file__
+        new_obj.__line__ = obj.__line__
+    except AttributeError:
+        # Not annotated or created without a start mark
+        pass
@@ -4,3 +4,8 @@ cdef object NodeDictClass
 cdef object NodeStrClass
 
 from .reference cimport _add_reference_to_node_class
+from .reference_object cimport _add_reference
+
+
+@cython.locals(nodes=list)
+cpdef object _handle_mapping_tag(object loader, object node)
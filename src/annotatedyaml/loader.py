@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import fnmatch
 import logging
 import os
+import threading
+from collections import OrderedDict
 from collections.abc import Callable, Iterator
-from io import StringIO, TextIOWrapper
 from pathlib import Path
-from typing import Any, TextIO
+from typing import Any, BinaryIO, TextIO
 
 import yaml
 
@@ -22,8 +22,7 @@ except ImportError:
         SafeLoader as FastestAvailableSafeLoader,
     )
 
-from propcache.api import cached_property
-
+from .clone import _fast_clone
 from .const import SECRET_YAML
 from .constructors import _construct_seq, _handle_mapping_tag, _handle_scalar_tag
 from .exceptions import YAMLException, YamlTypeError
@@ -37,6 +36,11 @@ JSON_TYPE = list | dict | str
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parsed documents keyed by path as given, validated by (mtime, size, inode)
+_YAML_CACHE: OrderedDict[str, tuple[int, int, int, JSON_TYPE | None]] = OrderedDict()
+_YAML_CACHE_MAXSIZE = 100
+_YAML_CACHE_LOCK = threading.Lock()
+
 
 class Secrets:
     """Store secrets while loading YAML."""
@@ -45,30 +49,40 @@ class Secrets:
         """Initialize secrets."""
         self.config_dir = config_dir
         self._cache: dict[Path, dict[str, str]] = {}
+        # Resolved secrets keyed by (requester directory, secret)
+        self._secret_resolution: dict[tuple[str, str], str] = {}
+        # Prefix shared by all paths inside the config dir
+        self._config_dir_prefix = os.path.join(
+            os.path.normcase(os.path.abspath(config_dir)), ""
+        )
 
     def get(self, requester_path: str, secret: str) -> str:
         """Return the value of a secret."""
-        current_path = Path(requester_path)
+        key = (os.path.dirname(requester_path), secret)
+        if key in self._secret_resolution:
+            return self._secret_resolution[key]
 
-        secret_dir = current_path
-        while True:
-            secret_dir = secret_dir.parent
-
-            try:
-                secret_dir.relative_to(self.config_dir)
-            except ValueError:
-                # We went above the config dir
-                break
+        current_path = Path(requester_path)
 
-            secrets = self._load_secret_yaml(secret_dir)
+        # Only look in folders between the requester and the config dir
+        requester_dir = os.path.join(
+            os.path.normcase(os.path.abspath(current_path.parent)), ""
+        )
+        if requester_dir.startswith(self._config_dir_prefix):
+            for secret_dir in current_path.parents:
+                secrets = self._load_secret_yaml(secret_dir)
+
+                if secret in secrets:
+                    _LOGGER.debug(
+                        "Secret %s retrieved from secrets.yaml in folder %s",
+                        secret,
+                        secret_dir,
+                    )
+                    self._secret_resolution[key] = secrets[secret]
+                    return secrets[secret]
 
-            if secret in secrets:
-                _LOGGER.debug(
-                    "Secret %s retrieved from secrets.yaml in folder %s",
-                    secret,
-                    secret_dir,
-                )
-                return secrets[secret]
+                if secret_dir == self.config_dir:
+                    break
 
         raise YAMLException(f"Secret {secret} not defined")
 
@@ -110,16 +124,21 @@ class _LoaderMixin:
 
     name: str
     stream: Any
-
-    @cached_property
-    def get_name(self) -> str:
-        """Get the name of the loader."""
-        return self.name
-
-    @cached_property
-    def get_stream_name(self) -> str:
-        """Get the name of the stream."""
-        return getattr(self.stream, "name", "")
+    secrets: Secrets | None
+    get_name: str
+    get_stream_name: str
+    get_base_dir: str
+    cacheable: bool
+
+    def _setup_mixin(self, secrets: Secrets | None) -> None:
+        """Set the attributes shared by the loaders once the stream is known."""
+        self.secrets = secrets
+        # Plain attributes as they are read for every node
+        self.get_name = self.name
+        self.get_stream_name = getattr(self.stream, "name", "")
+        self.get_base_dir = os.path.dirname(self.name)
+        # Cleared by constructors that are not known to only use the document
+        self.cacheable = True
 
 
 class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
@@ -138,7 +157,17 @@ class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
             self.name = getattr(stream, "name", "<file>")
 
         super().__init__(stream)
-        self.secrets = secrets
+        self._setup_mixin(secrets)
+
+    @classmethod
+    def add_constructor(cls, tag: Any, constructor: Any) -> None:
+        """Add a constructor, marking documents using it as not cacheable."""
+        super().add_constructor(tag, _wrap_constructor(constructor))
+
+    @classmethod
+    def add_multi_constructor(cls, tag_prefix: Any, multi_constructor: Any) -> None:
+        """Add a multi constructor, marking documents using it as not cacheable."""
+        super().add_multi_constructor(tag_prefix, _uncacheable(multi_constructor))
 
 
 class PythonSafeLoader(yaml.SafeLoader, _LoaderMixin):
@@ -147,7 +176,17 @@ class PythonSafeLoader(yaml.SafeLoader, _LoaderMixin):
     def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
-        self.secrets = secrets
+        self._setup_mixin(secrets)
+
+    @classmethod
+    def add_constructor(cls, tag: Any, constructor: Any) -> None:
+        """Add a constructor, marking documents using it as not cacheable."""
+        super().add_constructor(tag, _wrap_constructor(constructor))
+
+    @classmethod
+    def add_multi_constructor(cls, tag_prefix: Any, multi_constructor: Any) -> None:
+        """Add a multi constructor, marking documents using it as not cacheable."""
+        super().add_multi_constructor(tag_prefix, _uncacheable(multi_constructor))
 
 
 type LoaderType = FastSafeLoader | PythonSafeLoader
@@ -161,10 +200,32 @@ def load_yaml(
 
     If opening the file raises an OSError it will be wrapped in a YAMLException,
     except for FileNotFoundError which will be re-raised.
+
+    Documents that only use the built-in mapping, sequence, scalar and !input
+    constructors are cached and only parsed again when the file is modified.
     """
+    signature: tuple[int, int, int] | None = None
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        # Let open raise the appropriate error
+        pass
+    else:
+        # The path is part of the annotations, so it is not normalized
+        key = os.fspath(fname)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with _YAML_CACHE_LOCK:
+            cached = _YAML_CACHE.get(key)
+            if cached is not None:
+                if cached[:3] == signature:
+                    _YAML_CACHE.move_to_end(key)
+                    return _fast_clone(cached[3])
+                del _YAML_CACHE[key]
+
     try:
-        with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+        # Read as bytes, libyaml decodes UTF-8 itself
+        with open(fname, "rb") as conf_file:
+            loaded_yaml, cacheable = _parse_yaml_with_fallback(conf_file, secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise YAMLException(exc) from exc
@@ -173,6 +234,17 @@ def load_yaml(
     except OSError as exc:
         raise YAMLException(exc) from exc
 
+    if signature is not None and cacheable:
+        value = _fast_clone(loaded_yaml)
+        with _YAML_CACHE_LOCK:
+            _YAML_CACHE[key] = (*signature, value)
+            if len(_YAML_CACHE) > _YAML_CACHE_MAXSIZE:
+                _YAML_CACHE.popitem(last=False)
+    return loaded_yaml
+
+
+load_yaml.cache_clear = _YAML_CACHE.clear  # type: ignore[attr-defined]
+
 
 def load_yaml_dict(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
@@ -192,9 +264,16 @@ def load_yaml_dict(
 
 
 def parse_yaml(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | bytes | TextIO | BinaryIO, secrets: Secrets | None = None
 ) -> JSON_TYPE:
     """Parse YAML with the fastest available loader."""
+    return _parse_yaml_with_fallback(content, secrets)[0]
+
+
+def _parse_yaml_with_fallback(
+    content: str | bytes | TextIO | BinaryIO, secrets: Secrets | None = None
+) -> tuple[JSON_TYPE, bool]:
+    """Parse YAML and report if the result only depends on the content."""
     if not HAS_C_LOADER:
         return _parse_yaml_python(content, secrets)
     try:
@@ -202,15 +281,15 @@ def parse_yaml(
     except yaml.YAMLError:
         # Loading failed, so we now load with the Python loader which has more
         # readable exceptions
-        if isinstance(content, (StringIO, TextIO, TextIOWrapper)):
+        if not isinstance(content, str) and hasattr(content, "seek"):
             # Rewind the stream so we can try again
             content.seek(0, 0)
         return _parse_yaml_python(content, secrets)
 
 
 def _parse_yaml_python(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
-) -> JSON_TYPE:
+    content: str | bytes | TextIO | BinaryIO, secrets: Secrets | None = None
+) -> tuple[JSON_TYPE, bool]:
     """Parse YAML with the python loader (this is very slow)."""
     try:
         return _parse_yaml(PythonSafeLoader, content, secrets)
@@ -221,11 +300,15 @@ def _parse_yaml_python(
 
 def _parse_yaml(
     loader: type[FastSafeLoader | PythonSafeLoader],
-    content: str | TextIO,
+    content: str | bytes | TextIO | BinaryIO,
     secrets: Secrets | None = None,
-) -> JSON_TYPE:
+) -> tuple[JSON_TYPE, bool]:
     """Load a YAML file."""
-    return yaml.load(content, Loader=lambda stream: loader(stream, secrets))  # type: ignore[arg-type]  # noqa: S506
+    yaml_loader = loader(content, secrets)
+    try:
+        return yaml_loader.get_single_data(), yaml_loader.cacheable
+    finally:
+        yaml_loader.dispose()
 
 
 def _raise_if_no_value[NodeT: yaml.nodes.Node, R](
@@ -248,7 +331,7 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
         device_tracker: !include device_tracker.yaml
 
     """
-    fname = os.path.join(os.path.dirname(loader.get_name), node.value)
+    fname = os.path.join(loader.get_base_dir, node.value)
     try:
         loaded_yaml = load_yaml(fname, loader.secrets)
         if loaded_yaml is None:
@@ -263,26 +346,50 @@ def _is_file_valid(name: str) -> bool:
     return not name.startswith(".")
 
 
-def _find_files(directory: str, pattern: str) -> Iterator[str]:
+def _find_files(
+    directory: str,
+    suffixes: tuple[str, ...],
+    skip: frozenset[str] = frozenset((SECRET_YAML,)),
+) -> Iterator[str]:
     """Recursively load files in a directory."""
-    for root, dirs, files in os.walk(directory, topdown=True):
-        dirs[:] = [d for d in dirs if _is_file_valid(d)]
+    stack = [directory]
+    while stack:
+        root = stack.pop()
+        files: list[str] = []
+        dirs: list[str] = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if not _is_file_valid(entry.name):
+                        continue
+                    if entry.is_dir():
+                        # Like os.walk, do not descend into symlinked directories
+                        if not entry.is_symlink():
+                            dirs.append(entry.path)
+                    elif entry.name.endswith(suffixes) and entry.name not in skip:
+                        files.append(entry.name)
+        except OSError:
+            continue
         for basename in sorted(files):
-            if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
-                filename = os.path.join(root, basename)
-                yield filename
+            yield os.path.join(root, basename)
+        # Reversed so the directories are popped in sorted order
+        stack.extend(sorted(dirs, reverse=True))
+
+
+def _load_dir(loc: str, secrets: Secrets | None) -> list[tuple[str, JSON_TYPE | None]]:
+    """Load the YAML files in a directory."""
+    return [
+        (fname, load_yaml(fname, secrets)) for fname in _find_files(loc, (".yaml",))
+    ]
 
 
 @_raise_if_no_value
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
-    loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    loc = os.path.join(loader.get_base_dir, node.value)
+    for fname, loaded_yaml in _load_dir(loc, loader.secrets):
         filename = os.path.splitext(os.path.basename(fname))[0]
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
         if loaded_yaml is None:
             # Special case, an empty file included by !include_dir_named is treated
             # as an empty dictionary
@@ -298,11 +405,8 @@ def _include_dir_merge_named_yaml(
 ) -> NodeDictClass:
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
-    loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+    loc = os.path.join(loader.get_base_dir, node.value)
+    for _, loaded_yaml in _load_dir(loc, loader.secrets):
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     _add_reference_to_node_class(mapping, loader, node)
@@ -314,12 +418,11 @@ def _include_dir_list_yaml(
     loader: LoaderType, node: yaml.nodes.Node
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
-    loc = os.path.join(os.path.dirname(loader.get_name), node.value)
+    loc = os.path.join(loader.get_base_dir, node.value)
     return [
         loaded_yaml
-        for f in _find_files(loc, "*.yaml")
-        if os.path.basename(f) != SECRET_YAML
-        and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
+        for _, loaded_yaml in _load_dir(loc, loader.secrets)
+        if loaded_yaml is not None
     ]
 
 
@@ -328,12 +431,9 @@ def _include_dir_merge_list_yaml(
     loader: LoaderType, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
-    loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
+    loc: str = os.path.join(loader.get_base_dir, node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+    for _, loaded_yaml in _load_dir(loc, loader.secrets):
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
@@ -341,15 +441,16 @@ def _include_dir_merge_list_yaml(
 
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
-    args = node.value.split()
+    args = node.value.split(maxsplit=1)
 
     # Check for a default value
     if len(args) > 1:
-        return os.getenv(args[0], " ".join(args[1:]))
-    if args[0] in os.environ:
+        return os.environ.get(args[0], args[1])
+    try:
         return os.environ[args[0]]
-    _LOGGER.error("Environment variable %s not defined", node.value)
-    raise YAMLException(node.value)
+    except KeyError:
+        _LOGGER.error("Environment variable %s not defined", node.value)
+        raise YAMLException(node.value) from None
 
 
 def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
@@ -360,6 +461,32 @@ def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     return loader.secrets.get(loader.get_name, node.value)
 
 
+def _uncacheable(constructor: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a constructor so documents using it are not cached."""
+
+    def _construct(loader: LoaderType, *args: Any) -> Any:
+        loader.cacheable = False
+        return constructor(loader, *args)
+
+    return _construct
+
+
+# Constructors that only depend on the document itself
+_CACHEABLE_CONSTRUCTORS = (
+    _handle_mapping_tag,
+    _handle_scalar_tag,
+    _construct_seq,
+    Input.from_node,
+)
+
+
+def _wrap_constructor(constructor: Any) -> Any:
+    """Return the constructor to register, wrapped unless it is known cacheable."""
+    if constructor in _CACHEABLE_CONSTRUCTORS:
+        return constructor
+    return _uncacheable(constructor)
+
+
 def add_constructor(tag: Any, constructor: Any) -> None:
     """Add to constructor to all loaders."""
     for yaml_loader in (FastSafeLoader, PythonSafeLoader):
@@ -1,5 +1,5 @@
 
-cpdef _add_reference_to_node_class(
+cpdef void _add_reference_to_node_class(
     object obj,
     object loader,
     object node
@@ -0,0 +1,9 @@
+import cython
+
+cdef object NodeDictClass
+cdef object NodeListClass
+cdef object NodeStrClass
+
+from .reference cimport _add_reference_to_node_class
+
+cpdef object _add_reference(object obj, object loader, object node)
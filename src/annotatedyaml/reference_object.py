@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING
 
 import yaml
 
@@ -11,24 +11,6 @@ if TYPE_CHECKING:
     from .loader import LoaderType
 
 
-@overload
-def _add_reference(
-    obj: list | NodeListClass, loader: LoaderType, node: yaml.nodes.Node
-) -> NodeListClass: ...
-
-
-@overload
-def _add_reference(
-    obj: str | NodeStrClass, loader: LoaderType, node: yaml.nodes.Node
-) -> NodeStrClass: ...
-
-
-@overload
-def _add_reference(
-    obj: dict | NodeDictClass, loader: LoaderType, node: yaml.nodes.Node
-) -> NodeDictClass: ...
-
-
 def _add_reference(
     obj: dict | list | str | NodeDictClass | NodeListClass | NodeStrClass,
     loader: LoaderType,
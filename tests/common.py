@@ -3,6 +3,9 @@
 import logging
 import os
 import pathlib
+from collections.abc import Callable
+from contextlib import nullcontext
+from dataclasses import dataclass
 from io import StringIO
 from typing import Any, LiteralString
 from unittest.mock import patch
@@ -23,7 +26,7 @@ def patch_yaml_files(files_dict, endswith=True) -> Any:
     # match using endswith, start search with longest string
     matchlist = sorted(files_dict.keys(), key=len) if endswith else []
 
-    def mock_open_f(fname: str | pathlib.Path, **_: Any) -> StringIO:
+    def mock_open_f(fname: str | pathlib.Path, *_: Any, **__: Any) -> StringIO:
         """Mock open() in the yaml module, used by load_yaml."""
         # Return the mocked file on full match
         if isinstance(fname, pathlib.Path):
@@ -48,3 +51,36 @@ def patch_yaml_files(files_dict, endswith=True) -> Any:
         raise FileNotFoundError(msg)
 
     return patch.object(yaml_loader, "open", mock_open_f, create=True)
+
+
+@dataclass
+class FakeDirEntry:
+    """Minimal stand-in for os.DirEntry."""
+
+    name: str
+    path: str
+    dir: bool
+
+    def is_dir(self) -> bool:
+        return self.dir
+
+    def is_symlink(self) -> bool:
+        return False
+
+
+def fake_scandir(
+    tree: list[list[Any]],
+) -> Callable[[str], nullcontext[list[FakeDirEntry]]]:
+    """Return a fake os.scandir for a tree in the os.walk format."""
+    listing = {
+        root: [FakeDirEntry(d, os.path.join(root, d), True) for d in dirs]
+        + [FakeDirEntry(f, os.path.join(root, f), False) for f in files]
+        for root, dirs, files in tree
+    }
+
+    def scandir(path: str) -> nullcontext[list[FakeDirEntry]]:
+        if path not in listing:
+            raise FileNotFoundError(path)
+        return nullcontext(listing[path])
+
+    return scandir
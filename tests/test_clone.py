@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import datetime
+
+from annotatedyaml.clone import _fast_clone
+from annotatedyaml.loader import parse_yaml
+from annotatedyaml.objects import Input, NodeDictClass, NodeListClass, NodeStrClass
+
+
+def test_fast_clone_keeps_references():
+    """Test cloning copies containers and their file references."""
+    data = parse_yaml("key:\n  - value\n  - 1\nother: !input name\n")
+    clone = _fast_clone(data)
+    assert clone == data
+    assert clone is not data
+    assert clone["key"] is not data["key"]
+    assert isinstance(clone, NodeDictClass)
+    assert isinstance(clone["key"], NodeListClass)
+    assert isinstance(clone["key"][0], NodeStrClass)
+    assert clone["key"][0].__line__ == 2
+    assert clone["key"][0].__config_file__ == "<unicode string>"
+    assert clone["other"] == Input("name")
+
+
+def test_fast_clone_anchors():
+    """Test objects shared through anchors stay shared, even when recursive."""
+    data = parse_yaml("a: &x [1]\nb: *x\n")
+    clone = _fast_clone(data)
+    assert clone["a"] is clone["b"]
+    assert clone["a"] is not data["a"]
+
+    recursive = NodeListClass()
+    recursive.append(recursive)
+    clone = _fast_clone(recursive)
+    assert clone[0] is clone
+    assert clone is not recursive
+
+
+def test_fast_clone_other_types():
+    """Test plain containers, missing references and other types are copied."""
+    node_list = NodeListClass([{"key": [datetime.date(2024, 1, 1)]}, {1, 2}])
+    clone = _fast_clone(node_list)
+    assert clone == node_list
+    assert not hasattr(clone, "__config_file__")
+    assert type(clone[0]) is dict
+    assert clone[0]["key"] is not node_list[0]["key"]
+    assert clone[1] is not node_list[1]
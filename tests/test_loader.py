@@ -16,7 +16,7 @@ import yaml as pyyaml
 import annotatedyaml as yaml_util
 from annotatedyaml import YAMLException
 from annotatedyaml import loader as yaml_loader
-from tests.common import YAML_CONFIG_FILE
+from tests.common import YAML_CONFIG_FILE, fake_scandir
 
 
 def _get_annotation(item: Any) -> tuple[str, int | str] | None:
@@ -114,6 +114,16 @@ def test_environment_variable_default() -> None:
     assert doc["password"] == "secret_password"  # noqa: S105
 
 
+@pytest.mark.usefixtures("try_both_loaders")
+def test_environment_variable_default_with_spaces() -> None:
+    """Test a default value for an environment variable keeps its spaces."""
+    # Tab after the name, runs of spaces inside the default
+    conf = r'password: !env_var "PASSWORD\tsecret   pass  word"'
+    with io.StringIO(conf) as file:
+        doc = yaml_loader.parse_yaml(file)
+    assert doc["password"] == "secret   pass  word"  # noqa: S105
+
+
 @pytest.mark.usefixtures("try_both_loaders")
 def test_invalid_environment_variable() -> None:
     """Test config file with no environment variable sat."""
@@ -139,7 +149,7 @@ def test_include_yaml(mock_yaml_files: None, value: Any) -> None:
         assert doc["key"] == value
 
 
-@patch("annotatedyaml.loader.os.walk")
+@patch("annotatedyaml.loader.os.scandir")
 @pytest.mark.parametrize(
     ("mock_yaml_files", "value"),
     [
@@ -149,9 +159,11 @@ def test_include_yaml(mock_yaml_files: None, value: Any) -> None:
     ],
 )
 @pytest.mark.usefixtures("try_both_loaders", "patch_yaml_config")
-def test_include_dir_list(mock_walk: Mock, mock_yaml_files: None, value: Any) -> None:
+def test_include_dir_list(
+    mock_scandir: Mock, mock_yaml_files: None, value: Any
+) -> None:
     """Test include dir list yaml."""
-    mock_walk.return_value = [["/test", [], ["two.yaml", "one.yaml"]]]
+    mock_scandir.side_effect = fake_scandir([["/test", [], ["two.yaml", "one.yaml"]]])
 
     conf = "key: !include_dir_list /test"
     with io.StringIO(conf) as file:
@@ -159,7 +171,7 @@ def test_include_dir_list(mock_walk: Mock, mock_yaml_files: None, value: Any) ->
         assert sorted(doc["key"]) == sorted(value)
 
 
-@patch("annotatedyaml.loader.os.walk")
+@patch("annotatedyaml.loader.os.scandir")
 @pytest.mark.parametrize(
     "mock_yaml_files",
     [
@@ -171,24 +183,28 @@ def test_include_dir_list(mock_walk: Mock, mock_yaml_files: None, value: Any) ->
     ],
 )
 @pytest.mark.usefixtures("try_both_loaders", "patch_yaml_config")
-def test_include_dir_list_recursive(mock_walk: Mock, mock_yaml_files: None) -> None:
+def test_include_dir_list_recursive(mock_scandir: Mock, mock_yaml_files: None) -> None:
     """Test include dir recursive list yaml."""
-    mock_walk.return_value = [
-        ["/test", ["tmp2", ".ignore", "ignore"], ["zero.yaml"]],
-        ["/test/tmp2", [], ["one.yaml", "two.yaml"]],
-        ["/test/ignore", [], [".ignore.yaml"]],
-    ]
+    mock_scandir.side_effect = fake_scandir(
+        [
+            ["/test", ["tmp2", ".ignore", "ignore"], ["zero.yaml"]],
+            ["/test/tmp2", [], ["one.yaml", "two.yaml"]],
+            ["/test/ignore", [], [".ignore.yaml"]],
+        ]
+    )
 
     conf = "key: !include_dir_list /test"
     with io.StringIO(conf) as file:
-        assert ".ignore" in mock_walk.return_value[0][1], "Expecting .ignore in here"
         doc = yaml_loader.parse_yaml(file)
-        assert "tmp2" in mock_walk.return_value[0][1]
-        assert ".ignore" not in mock_walk.return_value[0][1]
+        assert [call.args[0] for call in mock_scandir.call_args_list] == [
+            "/test",
+            "/test/ignore",
+            "/test/tmp2",
+        ]
         assert sorted(doc["key"]) == sorted(["zero", "one", "two"])
 
 
-@patch("annotatedyaml.loader.os.walk")
+@patch("annotatedyaml.loader.os.scandir")
 @pytest.mark.parametrize(
     ("mock_yaml_files", "value"),
     [
@@ -207,11 +223,13 @@ def test_include_dir_list_recursive(mock_walk: Mock, mock_yaml_files: None) -> N
     ],
 )
 @pytest.mark.usefixtures("try_both_loaders", "patch_yaml_config")
-def test_include_dir_named(mock_walk: Mock, mock_yaml_files: None, value: Any) -> None:
+def test_include_dir_named(
+    mock_scandir: Mock, mock_yaml_files: None, value: Any
+) -> None:
     """Test include dir named yaml."""
-    mock_walk.return_value = [
-        ["/test", [], ["first.yaml", "second.yaml", "secrets.yaml"]]
-    ]
+    mock_scandir.side_effect = fake_scandir(
+        [["/test", [], ["first.yaml", "second.yaml", "secrets.yaml"]]]
+    )
 
     conf = "key: !include_dir_named /test"
     with io.StringIO(conf) as file:
@@ -219,7 +237,7 @@ def test_include_dir_named(mock_walk: Mock, mock_yaml_files: None, value: Any) -
         assert doc["key"] == value
 
 
-@patch("annotatedyaml.loader.os.walk")
+@patch("annotatedyaml.loader.os.scandir")
 @pytest.mark.parametrize(
     "mock_yaml_files",
     [
@@ -231,25 +249,29 @@ def test_include_dir_named(mock_walk: Mock, mock_yaml_files: None, value: Any) -
     ],
 )
 @pytest.mark.usefixtures("try_both_loaders", "patch_yaml_config")
-def test_include_dir_named_recursive(mock_walk: Mock, mock_yaml_files: None) -> None:
+def test_include_dir_named_recursive(mock_scandir: Mock, mock_yaml_files: None) -> None:
     """Test include dir named yaml."""
-    mock_walk.return_value = [
-        ["/test", ["tmp2", ".ignore", "ignore"], ["first.yaml"]],
-        ["/test/tmp2", [], ["second.yaml", "third.yaml"]],
-        ["/test/ignore", [], [".ignore.yaml"]],
-    ]
+    mock_scandir.side_effect = fake_scandir(
+        [
+            ["/test", ["tmp2", ".ignore", "ignore"], ["first.yaml"]],
+            ["/test/tmp2", [], ["second.yaml", "third.yaml"]],
+            ["/test/ignore", [], [".ignore.yaml"]],
+        ]
+    )
 
     conf = "key: !include_dir_named /test"
     correct = {"first": "one", "second": "two", "third": "three"}
     with io.StringIO(conf) as file:
-        assert ".ignore" in mock_walk.return_value[0][1], "Expecting .ignore in here"
         doc = yaml_loader.parse_yaml(file)
-        assert "tmp2" in mock_walk.return_value[0][1]
-        assert ".ignore" not in mock_walk.return_value[0][1]
+        assert [call.args[0] for call in mock_scandir.call_args_list] == [
+            "/test",
+            "/test/ignore",
+            "/test/tmp2",
+        ]
         assert doc["key"] == correct
 
 
-@patch("annotatedyaml.loader.os.walk")
+@patch("annotatedyaml.loader.os.scandir")
 @pytest.mark.parametrize(
     ("mock_yaml_files", "value"),
     [
@@ -269,10 +291,12 @@ def test_include_dir_named_recursive(mock_walk: Mock, mock_yaml_files: None) ->
 )
 @pytest.mark.usefixtures("try_both_loaders", "patch_yaml_config")
 def test_include_dir_merge_list(
-    mock_walk: Mock, mock_yaml_files: None, value: Any
+    mock_scandir: Mock, mock_yaml_files: None, value: Any
 ) -> None:
     """Test include dir merge list yaml."""
-    mock_walk.return_value = [["/test", [], ["first.yaml", "second.yaml"]]]
+    mock_scandir.side_effect = fake_scandir(
+        [["/test", [], ["first.yaml", "second.yaml"]]]
+    )
 
     conf = "key: !include_dir_merge_list /test"
     with io.StringIO(conf) as file:
@@ -280,7 +304,7 @@ def test_include_dir_merge_list(
         assert sorted(doc["key"]) == sorted(value)
 
 
-@patch("annotatedyaml.loader.os.walk")
+@patch("annotatedyaml.loader.os.scandir")
 @pytest.mark.parametrize(
     "mock_yaml_files",
     [
@@ -293,25 +317,29 @@ def test_include_dir_merge_list(
 )
 @pytest.mark.usefixtures("try_both_loaders", "patch_yaml_config")
 def test_include_dir_merge_list_recursive(
-    mock_walk: Mock, mock_yaml_files: None
+    mock_scandir: Mock, mock_yaml_files: None
 ) -> None:
     """Test include dir merge list yaml."""
-    mock_walk.return_value = [
-        ["/test", ["tmp2", ".ignore", "ignore"], ["first.yaml"]],
-        ["/test/tmp2", [], ["second.yaml", "third.yaml"]],
-        ["/test/ignore", [], [".ignore.yaml"]],
-    ]
+    mock_scandir.side_effect = fake_scandir(
+        [
+            ["/test", ["tmp2", ".ignore", "ignore"], ["first.yaml"]],
+            ["/test/tmp2", [], ["second.yaml", "third.yaml"]],
+            ["/test/ignore", [], [".ignore.yaml"]],
+        ]
+    )
 
     conf = "key: !include_dir_merge_list /test"
     with io.StringIO(conf) as file:
-        assert ".ignore" in mock_walk.return_value[0][1], "Expecting .ignore in here"
         doc = yaml_loader.parse_yaml(file)
-        assert "tmp2" in mock_walk.return_value[0][1]
-        assert ".ignore" not in mock_walk.return_value[0][1]
+        assert [call.args[0] for call in mock_scandir.call_args_list] == [
+            "/test",
+            "/test/ignore",
+            "/test/tmp2",
+        ]
         assert sorted(doc["key"]) == sorted(["one", "two", "three", "four"])
 
 
-@patch("annotatedyaml.loader.os.walk")
+@patch("annotatedyaml.loader.os.scandir")
 @pytest.mark.parametrize(
     ("mock_yaml_files", "value"),
     [
@@ -340,10 +368,12 @@ def test_include_dir_merge_list_recursive(
 )
 @pytest.mark.usefixtures("try_both_loaders", "patch_yaml_config")
 def test_include_dir_merge_named(
-    mock_walk: Mock, mock_yaml_files: None, value: Any
+    mock_scandir: Mock, mock_yaml_files: None, value: Any
 ) -> None:
     """Test include dir merge named yaml."""
-    mock_walk.return_value = [["/test", [], ["first.yaml", "second.yaml"]]]
+    mock_scandir.side_effect = fake_scandir(
+        [["/test", [], ["first.yaml", "second.yaml"]]]
+    )
 
     conf = "key: !include_dir_merge_named /test"
     with io.StringIO(conf) as file:
@@ -351,7 +381,7 @@ def test_include_dir_merge_named(
         assert doc["key"] == value
 
 
-@patch("annotatedyaml.loader.os.walk")
+@patch("annotatedyaml.loader.os.scandir")
 @pytest.mark.parametrize(
     "mock_yaml_files",
     [
@@ -364,21 +394,25 @@ def test_include_dir_merge_named(
 )
 @pytest.mark.usefixtures("try_both_loaders", "patch_yaml_config")
 def test_include_dir_merge_named_recursive(
-    mock_walk: Mock, mock_yaml_files: None
+    mock_scandir: Mock, mock_yaml_files: None
 ) -> None:
     """Test include dir merge named yaml."""
-    mock_walk.return_value = [
-        ["/test", ["tmp2", ".ignore", "ignore"], ["first.yaml"]],
-        ["/test/tmp2", [], ["second.yaml", "third.yaml"]],
-        ["/test/ignore", [], [".ignore.yaml"]],
-    ]
+    mock_scandir.side_effect = fake_scandir(
+        [
+            ["/test", ["tmp2", ".ignore", "ignore"], ["first.yaml"]],
+            ["/test/tmp2", [], ["second.yaml", "third.yaml"]],
+            ["/test/ignore", [], [".ignore.yaml"]],
+        ]
+    )
 
     conf = "key: !include_dir_merge_named /test"
     with io.StringIO(conf) as file:
-        assert ".ignore" in mock_walk.return_value[0][1], "Expecting .ignore in here"
         doc = yaml_loader.parse_yaml(file)
-        assert "tmp2" in mock_walk.return_value[0][1]
-        assert ".ignore" not in mock_walk.return_value[0][1]
+        assert [call.args[0] for call in mock_scandir.call_args_list] == [
+            "/test",
+            "/test/ignore",
+            "/test/tmp2",
+        ]
         assert doc["key"] == {
             "key1": "one",
             "key2": "two",
@@ -599,3 +633,190 @@ def test_getting_annotation(mock_yaml: None) -> None:
     """Test we can fetch annotations in pure python."""
     data = yaml_loader.load_yaml(YAML_CONFIG_FILE)
     assert _get_annotation(data) == ("test.yaml", 1)
+
+
+def test_load_yaml_cache(tmp_path: pathlib.Path) -> None:
+    """Test loading an unchanged file returns a copy of the cached result."""
+    path = tmp_path / "cached.yaml"
+    path.write_text("key:\n  - value\n")
+
+    with patch.object(
+        yaml_loader,
+        "_parse_yaml_with_fallback",
+        wraps=yaml_loader._parse_yaml_with_fallback,
+    ) as mock_parse:
+        first = yaml_loader.load_yaml(path)
+        first["key"].append("modified")
+        second = yaml_loader.load_yaml(path)
+
+    assert mock_parse.call_count == 1
+    assert second == {"key": ["value"]}
+    assert _get_annotation(second) == (str(path), 1)
+    assert _get_annotation(second["key"][0]) == (str(path), 2)
+
+    path.write_text("key: changed\n")
+    assert yaml_loader.load_yaml(path) == {"key": "changed"}
+
+    yaml_loader.load_yaml.cache_clear()
+    assert not yaml_loader._YAML_CACHE
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "key: !include other.yaml",
+        "key: !env_var TEST_CACHE_ENV",
+        "key: !include_dir_list other",
+    ],
+)
+def test_load_yaml_cache_skips_external_data(
+    tmp_path: pathlib.Path, content: str
+) -> None:
+    """Test documents depending on data outside the file are not cached."""
+    (tmp_path / "other.yaml").write_text("included")
+    (tmp_path / "other").mkdir()
+    path = tmp_path / "config.yaml"
+    path.write_text(content)
+
+    with patch.dict(os.environ, {"TEST_CACHE_ENV": "env"}):
+        yaml_loader.load_yaml(path)
+
+    assert str(path) not in yaml_loader._YAML_CACHE
+
+
+def test_load_yaml_cache_keeps_path_spelling(tmp_path: pathlib.Path) -> None:
+    """Test the cache returns the annotations for the path that was requested."""
+    (tmp_path / "cfg").mkdir()
+    path = tmp_path / "config.yaml"
+    path.write_text("key: value")
+    other_spelling = tmp_path / "cfg" / ".." / "config.yaml"
+
+    assert _get_annotation(yaml_loader.load_yaml(other_spelling)["key"]) == (
+        str(other_spelling),
+        1,
+    )
+    assert _get_annotation(yaml_loader.load_yaml(path)["key"]) == (str(path), 1)
+    yaml_loader.load_yaml.cache_clear()
+
+
+def test_load_yaml_cache_skips_custom_tags(tmp_path: pathlib.Path) -> None:
+    """Test documents using constructors registered by others are not cached."""
+    path = tmp_path / "config.yaml"
+    path.write_text("key: !test_cache_tag value")
+
+    yaml_loader.add_constructor("!test_cache_tag", lambda loader, node: node.value)
+    try:
+        assert yaml_loader.load_yaml(path) == {"key": "value"}
+    finally:
+        for loader_class in (yaml_loader.FastSafeLoader, yaml_loader.PythonSafeLoader):
+            del loader_class.yaml_constructors["!test_cache_tag"]
+
+    assert str(path) not in yaml_loader._YAML_CACHE
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_load_yaml_cache_skips_tags_added_to_loader(tmp_path: pathlib.Path) -> None:
+    """Test constructors registered directly on the loaders are not cached."""
+    path = tmp_path / "config.yaml"
+    path.write_text("single: !test_dyn value\nmulti: !test_multi:x value")
+    state = {"value": "one"}
+
+    for loader_class in (yaml_loader.FastSafeLoader, yaml_loader.PythonSafeLoader):
+        loader_class.add_constructor("!test_dyn", lambda loader, node: state["value"])
+        loader_class.add_multi_constructor(
+            "!test_multi:", lambda loader, suffix, node: state["value"] + suffix
+        )
+    try:
+        assert yaml_loader.load_yaml(path) == {"single": "one", "multi": "onex"}
+        state["value"] = "two"
+        assert yaml_loader.load_yaml(path) == {"single": "two", "multi": "twox"}
+    finally:
+        for loader_class in (yaml_loader.FastSafeLoader, yaml_loader.PythonSafeLoader):
+            del loader_class.yaml_constructors["!test_dyn"]
+            del loader_class.yaml_multi_constructors["!test_multi:"]
+
+    assert str(path) not in yaml_loader._YAML_CACHE
+
+
+def test_load_yaml_cache_replaced_file(tmp_path: pathlib.Path) -> None:
+    """Test a file replaced with the same size and mtime is parsed again."""
+    path = tmp_path / "config.yaml"
+    path.write_text("key: old")
+    assert yaml_loader.load_yaml(path) == {"key": "old"}
+
+    replacement = tmp_path / "replacement.yaml"
+    replacement.write_text("key: new")
+    stat = path.stat()
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(replacement, path)
+
+    assert yaml_loader.load_yaml(path) == {"key": "new"}
+    yaml_loader.load_yaml.cache_clear()
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_parse_binary_stream_with_syntax_error() -> None:
+    """Test the stream is rewound before it is parsed again for a better error."""
+    with pytest.raises(YAMLException), io.BytesIO(b"key: [1, 2") as file:
+        yaml_loader.parse_yaml(file)
+
+
+def test_find_files(tmp_path: pathlib.Path) -> None:
+    """Test finding files on disk in a stable order."""
+    for path in (
+        "b.yaml",
+        "a.yaml",
+        "c.txt",
+        ".hidden.yaml",
+        "secrets.yaml",
+        "sub/d.yaml",
+    ):
+        (tmp_path / path).parent.mkdir(exist_ok=True)
+        (tmp_path / path).write_text("")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "e.yaml").write_text("")
+    (tmp_path / "link").symlink_to(tmp_path / "sub")
+
+    assert list(yaml_loader._find_files(str(tmp_path), (".yaml",))) == [
+        os.path.join(tmp_path, "a.yaml"),
+        os.path.join(tmp_path, "b.yaml"),
+        os.path.join(tmp_path, "sub", "d.yaml"),
+    ]
+    assert list(yaml_loader._find_files(str(tmp_path / "missing"), (".yaml",))) == []
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_load_yaml_reads_utf8_bytes(tmp_path: pathlib.Path) -> None:
+    """Test files are decoded as UTF-8 and invalid bytes are reported."""
+    path = tmp_path / "unicode.yaml"
+    path.write_bytes("key: ÄÖÜ 🎉\n".encode())
+    data = yaml_loader.load_yaml(path)
+    assert data == {"key": "ÄÖÜ 🎉"}
+    assert _get_annotation(data["key"]) == (str(path), 1)
+
+    path = tmp_path / "invalid.yaml"
+    path.write_bytes(b"key: \xc3\x28\n")
+    with pytest.raises(YAMLException):
+        yaml_loader.load_yaml(path)
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_include_dir_order(tmp_path: pathlib.Path) -> None:
+    """Test files from a directory are included in sorted order."""
+    include_dir = tmp_path / "include"
+    include_dir.mkdir()
+    names = [f"file{i:02}" for i in range(16)]
+    for name in names:
+        (include_dir / f"{name}.yaml").write_text(f"- {name}\n")
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        "list: !include_dir_merge_list include\nnamed: !include_dir_named include\n"
+    )
+
+    doc = yaml_loader.load_yaml(config)
+    assert doc["list"] == names
+    assert list(doc["named"]) == names
+    assert _get_annotation(doc["named"]["file03"]) == (
+        str(include_dir / "file03.yaml"),
+        1,
+    )
@@ -3,6 +3,7 @@
 import logging
 from dataclasses import dataclass
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -183,3 +184,30 @@ def test_secrets_are_not_dict(
     )
     with pytest.raises(YAMLException, match="Secrets is not a dictionary"):
         load_config_file(default_config.path, [default_config, non_dict_secrets])
+
+
+def test_secret_resolution_is_cached(
+    filepaths: dict[str, Path],
+    default_secrets: YamlFile,
+) -> None:
+    """Test repeated lookups from the same folder do not search again."""
+    secrets = yaml_loader.Secrets(filepaths["config"])
+    requester = (filepaths["sub_folder"] / "sub.yaml").as_posix()
+    with patch_yaml_files({default_secrets.path.as_posix(): default_secrets.contents}):
+        assert secrets.get(requester, "http_pw") == "pwhttp"
+
+    with patch.object(secrets, "_load_secret_yaml") as mock_load:
+        assert secrets.get(requester, "http_pw") == "pwhttp"
+        for unrelated in (
+            filepaths["config"].parent / "other.yaml",
+            filepaths["config"].with_name("testing_config2") / "other.yaml",
+        ):
+            with pytest.raises(YAMLException, match="Secret comp1_un not defined"):
+                secrets.get(unrelated.as_posix(), "comp1_un")
+
+    assert mock_load.call_count == 0
+
+    # A relative config dir is compared against the requester the same way
+    secrets = yaml_loader.Secrets(Path("."))
+    with patch_yaml_files({"secrets.yaml": "http_pw: pwhttp"}, endswith=False):
+        assert secrets.get("sub/sub.yaml", "http_pw") == "pwhttp"